@@ -27,6 +27,9 @@ from core.github_catalog import GitHubCatalog, upload_product_to_github
 from core.csv_generator import generate_csv, fill_row
 from core.utils import is_image_file
 
+# Verbatim output is kept as a rolling window; older lines are dropped
+VERBATIM_LOG_MAX_LINES = 2000
+
 ################################################################################
 # CONFIGURATION MANAGEMENT
 ################################################################################
@@ -43,17 +46,16 @@ class ConfigManager:
     def load_config(self):
         """Load configuration from settings.json, create from template if needed"""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    self.config = json.load(f)
+            # Open directly instead of checking existence first: one syscall, no race
+            try:
+                self.config = json.loads(Path(self.config_path).read_bytes())
                 print(f"✅ Loaded configuration from {self.config_path}")
-            else:
+            except FileNotFoundError:
                 # Create from template
-                if os.path.exists(self.template_path):
-                    with open(self.template_path, 'r') as f:
-                        self.config = json.load(f)
+                try:
+                    self.config = json.loads(Path(self.template_path).read_bytes())
                     print(f"⚠️  Created config from template. Please edit {self.config_path}")
-                else:
+                except FileNotFoundError:
                     # Create minimal config
                     self.config = {
                         "aws_access_key": "",
@@ -149,11 +151,27 @@ class GitHubUploadWorker(QThread):
 
 set -euo pipefail
 
+# Summarize porcelain output (count + first paths) instead of echoing every
+# changed path; each echoed line becomes a GUI signal and log append
+show_git_status() {{
+    local status_out
+    if ! status_out=$(git status --porcelain); then
+        echo "$1 failed"
+        return 0
+    fi
+    if [ -z "$status_out" ]; then
+        echo "0 changed path(s)"
+        return 0
+    fi
+    echo "$(printf '%s\n' "$status_out" | wc -l) changed path(s)"
+    printf '%s\n' "$status_out" | sed -n '1,5p'
+}}
+
 echo "🔧 VERBATIM SYSTEM MESSAGE CAPTURE ACTIVE"
 echo "📅 Timestamp: $(date)"
 echo "📁 Working Directory: $(pwd)"
 echo "🔧 Git Status:"
-git status --porcelain || echo "Git status failed"
+show_git_status "Git status"
 
 echo "📤 Executing original upload script..."
 
@@ -162,7 +180,7 @@ bash "{upload_script}" "{self.commit_message}"
 
 echo "✅ Upload script execution completed"
 echo "📊 Final git status:"
-git status --porcelain || echo "Final git status failed"
+show_git_status "Final git status"
 """
 
             # Write enhanced script to temp file
@@ -705,6 +723,7 @@ class IntegratedPostcardLister(QWidget):
         self.verbatim_log = QTextEdit()
         self.verbatim_log.setReadOnly(True)
         self.verbatim_log.setMaximumHeight(200)
+        self.verbatim_log.document().setMaximumBlockCount(VERBATIM_LOG_MAX_LINES)
         self.verbatim_log.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -11,31 +11,74 @@
 import subprocess
 import sys
 import os
+import re
+import json
+import shutil
 from datetime import datetime
 from pathlib import Path
 
+# ─── PRF‑P00: PRECHECK CACHE LOCATION ─────────────────────────────────────────
+# Keyed on the gh binary's path/mtime/size; a reinstall or upgrade invalidates it
+PRECHECK_CACHE = Path.home() / ".cache" / "prf_auto" / "precheck.json"
+
+def _gh_fingerprint():
+    gh_path = shutil.which("gh")
+    if not gh_path:
+        return None
+    st = os.stat(gh_path)
+    return [gh_path, st.st_mtime_ns, st.st_size]
+
+def _load_precheck_cache():
+    try:
+        return json.loads(PRECHECK_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _save_precheck_cache(data):
+    try:
+        PRECHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = PRECHECK_CACHE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, PRECHECK_CACHE)
+    except OSError:
+        pass  # Cache is an optimization only; never fail the run over it
+
 # ─── PRF‑P01: ENVIRONMENT PRECHECK ────────────────────────────────────────────
 def ensure_gh_installed():
+    fingerprint = _gh_fingerprint()
+    if fingerprint is None:
+        print("[FAIL] ❌ GitHub CLI not found — install `gh` before proceeding.")
+        sys.exit(1)
+    cache = _load_precheck_cache()
+    if cache.get("gh") == fingerprint:
+        return
     try:
-        subprocess.run(["gh", "--version"], check=True, stdout=subprocess.DEVNULL)
+        # Exit status is all we need: no pipes, and no fd-closing pass in the child
+        subprocess.run(
+            ["gh", "--version"], check=True, close_fds=False,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
     except Exception:
         print("[FAIL] ❌ GitHub CLI not found — install `gh` before proceeding.")
         sys.exit(1)
+    cache["gh"] = fingerprint
+    _save_precheck_cache(cache)
 
 # ─── PRF‑P02: VALIDATE TOKEN ──────────────────────────────────────────────────
+# Matches GH_TOKEN=value lines; tolerates spaces around "=" and quoted values
+GH_TOKEN_RE = re.compile(r"""^[ \t]*GH_TOKEN[ \t]*=[ \t]*["']?([^"'\s]+)["']?[ \t]*$""", re.M)
+
 def ensure_token():
     dotenv_path = Path(".env")
     if not dotenv_path.exists():
         dotenv_path.write_text("GH_TOKEN=__REPLACE_ME__\n")
         print("[INFO] 🔑 .env created — add a valid GH_TOKEN and re-run.")
         sys.exit(1)
-    with open(dotenv_path) as f:
-        for line in f:
-            if line.startswith("GH_TOKEN="):
-                token = line.strip().split("=", 1)[-1]
-                if token and "__REPLACE_ME__" not in token:
-                    os.environ["GH_TOKEN"] = token
-                    return
+    for match in GH_TOKEN_RE.finditer(dotenv_path.read_text()):
+        token = match.group(1)
+        if "__REPLACE_ME__" not in token:
+            os.environ["GH_TOKEN"] = token
+            return
     print("[FAIL] ❌ Invalid or missing GH_TOKEN in .env.")
     sys.exit(1)
 
@@ -64,8 +107,12 @@ def create_pr(branch):
 # ─── PRF‑P05: FALLBACK — DRAFT + COMMENT IF BLOCKED ───────────────────────────
 def fallback_draft(branch):
     try:
-        subprocess.run(["gh", "pr", "edit", "--add-label", "needs-review"], check=True)
-        subprocess.run(["gh", "pr", "edit", "--title", f"📌 Draft: {branch}"], check=True)
+        # Label and title are both PR fields — one edit call sets them together
+        subprocess.run([
+            "gh", "pr", "edit",
+            "--add-label", "needs-review",
+            "--title", f"📌 Draft: {branch}"
+        ], check=True)
         subprocess.run([
             "gh", "pr", "comment", "--body",
             "🔒 Auto-merge failed due to reviewer policy. Manual intervention required."
@@ -17,7 +17,7 @@ repo_root = Path.cwd()
 gitignore_path = repo_root / ".gitignore"
 
 # ─── REQUIRED ENTRIES ─────────────────────────────────────────────────────────
-required_entries = [
+required_entries = (
     ".env",
     "__pycache__/",
     "*.pyc",
@@ -40,7 +40,7 @@ required_entries = [
     ".ipynb_checkpoints/",
     ".parcel-cache/",
     "node_modules/"
-]
+)
 
 # ─── STEP 1: ENSURE FILE EXISTS ───────────────────────────────────────────────
 if not gitignore_path.exists():
@@ -48,9 +48,9 @@ if not gitignore_path.exists():
     gitignore_path.write_text("")  # create blank file
 
 # ─── STEP 2: PARSE EXISTING CONTENT ───────────────────────────────────────────
-existing_lines = set(
-    line.strip() for line in gitignore_path.read_text().splitlines() if line.strip()
-)
+existing_lines = {
+    entry for line in gitignore_path.read_text().splitlines() if (entry := line.strip())
+}
 
 # ─── STEP 3: DETERMINE PATCHES ────────────────────────────────────────────────
 missing = [entry for entry in required_entries if entry not in existing_lines]
@@ -61,9 +61,8 @@ if not missing:
 
 # ─── STEP 4: APPLY PATCHES ────────────────────────────────────────────────────
 with open(gitignore_path, "a") as f:
-    f.write("\n# ─── PRF-AUTO-GENERATED ENTRIES ───\n")
-    for entry in missing:
-        f.write(f"{entry}\n")
-        print(f"[PATCHED] ➕ {entry}")
+    f.write("\n# ─── PRF-AUTO-GENERATED ENTRIES ───\n" + "\n".join(missing) + "\n")
+for entry in missing:
+    print(f"[PATCHED] ➕ {entry}")
 
 print(f"[PASS] ✅ .gitignore patched with {len(missing)} missing entries.")
@@ -8,27 +8,35 @@
 # DEBUG: Each subprocess explicitly wrapped, reasoned, and terminal-audited
 ################################################################################
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+from prf_upload_to_github import TRACKING_RE
+
 # ─── PRF‑CLEAN01: FORCE‑CREATE REDACTED FILES ────────────────────────────────
 # WHAT: Guarantees re-creation of token files with safe dummy content
 # WHY: Required in cases where .gitignore or blob filters hide the files
 # FAIL: Push protection blocks HEAD if files are absent
 # UX: Emits "[INFO]" when re-created or "[SKIP]" when already valid
-# DEBUG: Full exception trace if any IO op fails
+# DEBUG: Full exception trace if any IO op fails; size is compared before reading
 def ensure_file(filename, contents):
     f = Path(filename)
+    target = contents.encode()
     try:
-        if not f.exists():
-            f.write_text(contents)
+        try:
+            size = os.stat(filename).st_size
+        except FileNotFoundError:
+            f.write_bytes(target)
             print(f"[INFO] 🆕 Created missing redacted file: {filename}")
-        elif f.read_text().strip() != contents.strip():
-            f.write_text(contents)
-            print(f"[INFO] 🔁 Rewrote redacted file: {filename}")
-        else:
+            return
+        # A size mismatch already proves the content differs — no read needed
+        if size == len(target) and f.read_bytes() == target:
             print(f"[SKIP] ✅ File already redacted: {filename}")
+        else:
+            f.write_bytes(target)
+            print(f"[INFO] 🔁 Rewrote redacted file: {filename}")
     except Exception as e:
         print(f"[FAIL] ❌ Could not ensure file {filename}: {e}")
         sys.exit(1)
@@ -37,14 +45,28 @@ def ensure_file(filename, contents):
 # WHAT: Removes leaked files from index to ensure reset visibility
 # WHY: Git filters may prevent add unless cache is cleared
 # FAIL: Index state can block further commit
-# UX: Always emits "[INFO]" for removed paths
-# DEBUG: Inline removal results
-def untrack_file_if_exists(file):
+# UX: Emits "[INFO]" for removed paths and "[SKIP]" for paths not in the index
+# DEBUG: One git invocation for all paths; per-path results parsed from its output
+def untrack_files_if_exist(files):
     try:
-        subprocess.run(["git", "rm", "--cached", "--ignore-unmatch", file], check=True)
-        print(f"[INFO] 🔄 Removed cached index of: {file}")
+        result = subprocess.run(
+            ["git", "rm", "--cached", "--ignore-unmatch", "--", *files],
+            # Only stdout is parsed; stderr stays on the terminal so git's error shows
+            check=True, stdout=subprocess.PIPE, text=True
+        )
     except subprocess.CalledProcessError as e:
-        print(f"[WARN] ⚠ Could not untrack '{file}' — proceeding: {e}")
+        print(f"[WARN] ⚠ Could not untrack {', '.join(files)} — proceeding: {e}")
+        return
+    # git reports each removal as: rm 'path'
+    removed = {
+        line[4:-1] for line in result.stdout.splitlines()
+        if line.startswith("rm '") and line.endswith("'")
+    }
+    for file in files:
+        if file in removed:
+            print(f"[INFO] 🔄 Removed cached index of: {file}")
+        else:
+            print(f"[SKIP] ✅ Not tracked: {file}")
 
 # ─── PRF‑CLEAN03: GIT RESET ───────────────────────────────────────────────────
 # WHAT: Hard-resets one commit prior to HEAD
@@ -68,9 +90,14 @@ def reset_history():
 # DEBUG: Captures all commit errors explicitly
 def commit_clean_state():
     try:
-        files = [".env", "postcard_lister_personal_access_token.txt"]
-        for file in files:
-            subprocess.run(["git", "add", "--force", file], check=True)
+        # A missing path would only make git add fail; filter before spawning
+        files = [f for f in (".env", "postcard_lister_personal_access_token.txt") if os.path.lexists(f)]
+        if not files:
+            # ensure_file just wrote both; neither surviving means the tree is
+            # broken, and the force-push that follows must not run on it
+            print("[FAIL] ❌ No redacted files found to commit.")
+            sys.exit(1)
+        subprocess.run(["git", "add", "--force", "--", *files], check=True)
         subprocess.run(["git", "commit", "-m", "🔒 PRF: Redacted secrets to comply with GH013"], check=True)
         print("[INFO] ✅ Redacted files committed.")
     except subprocess.CalledProcessError as e:
@@ -82,14 +109,22 @@ def commit_clean_state():
 # WHY: GitHub only clears GH013 violations on push
 # FAIL: Network or config errors = full script exit
 # UX: Confirms pushed branch and remote
-# DEBUG: Captures command error if push fails
+# DEBUG: Git resolves HEAD itself; branch is read back from push output
 def push_clean_history():
     try:
-        branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], text=True).strip()
-        subprocess.run(["git", "push", "-f", "-u", "origin", branch], check=True)
+        result = subprocess.run(
+            ["git", "push", "-f", "-u", "origin", "HEAD"],
+            check=True, stdout=subprocess.PIPE, text=True
+        )
+        sys.stdout.write(result.stdout)
+        match = TRACKING_RE.search(result.stdout)
+        branch = match.group(1) if match else "HEAD"
         print(f"[PASS] ✅ Clean history pushed to: origin/{branch}")
     except subprocess.CalledProcessError as e:
-        print(f"[FAIL] ❌ Push failed: {e}")
+        branch = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+        print(f"[FAIL] ❌ Push of '{branch}' failed: {e}")
         sys.exit(1)
 
 # ─── PRF‑CLEAN06: MAIN CONTROLLER ────────────────────────────────────────────
@@ -102,8 +137,7 @@ def main():
     print("[PRF] 🚨 START: GH013 Remediation Workflow")
     ensure_file(".env", "GH_TOKEN=__REDACTED__\n")
     ensure_file("postcard_lister_personal_access_token.txt", "GH_TOKEN=__REDACTED__\n")
-    untrack_file_if_exists(".env")
-    untrack_file_if_exists("postcard_lister_personal_access_token.txt")
+    untrack_files_if_exist([".env", "postcard_lister_personal_access_token.txt"])
     reset_history()
     commit_clean_state()
     push_clean_history()
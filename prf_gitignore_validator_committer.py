@@ -13,7 +13,7 @@ import sys
 from pathlib import Path
 
 # ─── PRF-P01: DEFINE REQUIRED ENTRIES ─────────────────────────────────────────
-REQUIRED_ENTRIES = [
+REQUIRED_ENTRIES = (
     ".env",
     "__pycache__/",
     "*.pyc",
@@ -36,7 +36,16 @@ REQUIRED_ENTRIES = [
     ".ipynb_checkpoints/",
     ".parcel-cache/",
     "node_modules/"
-]
+)
+
+# Entries are plain ASCII, so .gitignore is compared and patched as raw bytes
+REQUIRED_ENTRIES_BYTES = tuple(entry.encode() for entry in REQUIRED_ENTRIES)
+
+# Written once ahead of each batch of appended entries
+PATCH_HEADER = "\n# ─── PRF-AUTO-GENERATED ENTRIES ───\n".encode()
+
+# ─── PRF-P01b: REPOSITORY ROOT (RESOLVED ONCE AT IMPORT) ──────────────────────
+REPO_ROOT = Path.cwd()
 
 # ─── PRF-P02: ENSURE .GITIGNORE FILE EXISTS ──────────────────────────────────
 def ensure_gitignore_exists(path: Path):
@@ -51,8 +60,7 @@ def ensure_gitignore_exists(path: Path):
 # ─── PRF-P03: READ EXISTING ENTRIES SAFELY ────────────────────────────────────
 def load_existing_entries(path: Path):
     try:
-        lines = path.read_text().splitlines()
-        return set(line.strip() for line in lines if line.strip())
+        return {entry for line in path.read_bytes().splitlines() if (entry := line.strip())}
     except Exception as e:
         print(f"[FAIL] ❌ Cannot read .gitignore: {e}")
         sys.exit(1)
@@ -68,26 +76,25 @@ def apply_patch(path: Path, missing_entries):
         return
 
     print("[INFO] 📌 Patching .gitignore with missing entries:")
+    payload = PATCH_HEADER + b"\n".join(missing_entries) + b"\n"
     try:
-        with path.open("a") as f:
-            f.write("\n# ─── PRF-AUTO-GENERATED ENTRIES ───\n")
-            for entry in missing_entries:
-                f.write(f"{entry}\n")
-                print(f"[PATCHED] ➕ {entry}")
+        with path.open("ab") as f:
+            f.write(payload)
     except Exception as e:
         print(f"[FAIL] ❌ Unable to write to .gitignore: {e}")
         sys.exit(1)
+    for entry in missing_entries:
+        print(f"[PATCHED] ➕ {entry.decode()}")
 
     print(f"[PASS] ✅ .gitignore patched with {len(missing_entries)} entries.")
 
 # ─── PRF-P06: MAIN ENTRYPOINT ─────────────────────────────────────────────────
 def main():
-    repo_root = Path.cwd()
-    gitignore_path = repo_root / ".gitignore"
+    gitignore_path = REPO_ROOT / ".gitignore"
 
     ensure_gitignore_exists(gitignore_path)
     existing_entries = load_existing_entries(gitignore_path)
-    missing_entries = compute_missing(REQUIRED_ENTRIES, existing_entries)
+    missing_entries = compute_missing(REQUIRED_ENTRIES_BYTES, existing_entries)
     apply_patch(gitignore_path, missing_entries)
 
 if __name__ == "__main__":
@@ -7,23 +7,46 @@
 
 import sys
 import os
+import importlib.util
+
+# Modules the launcher needs: (display name, import name)
+REQUIRED_MODULES = (
+    ('PyQt5', 'PyQt5.QtWidgets'),
+    ('pandas', 'pandas'),
+    ('PIL', 'PIL'),
+    ('openai', 'openai'),
+    ('requests', 'requests')  # For GitHub API
+)
+
+CORE_MODULES = (
+    'core.vision_handler',
+    'core.enhanced_vision_handler',
+    'core.multi_llm_analyzer',
+    'core.image_processor',
+    'core.github_catalog',  # Replaces aws_uploader
+    'core.csv_generator',
+    'core.utils'
+)
+
+def module_available(import_name):
+    """Check whether a module can be imported without executing it"""
+    # Kept local rather than shared: this fallback path must run even when
+    # the self-healing modules are missing or broken
+    if sys.modules.get(import_name) is not None:
+        return True  # Already imported in this process; skip the finders
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        # Raised when a parent package is itself missing or broken
+        return False
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
-    required_modules = [
-        ('PyQt5', 'PyQt5.QtWidgets'),
-        ('pandas', 'pandas'),
-        ('PIL', 'PIL'),
-        ('openai', 'openai'),
-        ('requests', 'requests')  # For GitHub API
-    ]
-    
     missing = []
-    for name, import_name in required_modules:
-        try:
-            __import__(import_name)
+    for name, import_name in REQUIRED_MODULES:
+        if module_available(import_name):
             print(f"✅ {name} - OK")
-        except ImportError:
+        else:
             print(f"❌ {name} - MISSING")
             missing.append(name)
     
@@ -37,23 +60,12 @@ def check_dependencies():
 
 def check_core_modules():
     """Check if core modules are available"""
-    core_modules = [
-        'core.vision_handler',
-        'core.enhanced_vision_handler',
-        'core.multi_llm_analyzer',
-        'core.image_processor',
-        'core.github_catalog',  # Replaces aws_uploader
-        'core.csv_generator',
-        'core.utils'
-    ]
-    
     missing = []
-    for module in core_modules:
-        try:
-            __import__(module)
+    for module in CORE_MODULES:
+        if module_available(module):
             print(f"✅ {module} - OK")
-        except ImportError as e:
-            print(f"❌ {module} - MISSING: {e}")
+        else:
+            print(f"❌ {module} - MISSING")
             missing.append(module)
     
     if missing:
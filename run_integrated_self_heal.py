@@ -8,28 +8,94 @@
 # FAIL: Exits with clear error if self-healing fails
 # UX: Visible progress messages and status feedback
 # DEBUG: Logs all dependency checks and application startup
+# USAGE: python run_integrated_self_heal.py [--no-heal] [--deep-check]
+#   --no-heal     skip dependency self-healing (also: POSTCARD_LISTER_SKIP_HEAL=1)
+#   --deep-check  import each core module instead of only locating it
 ################################################################################
 
 import sys
 import os
-import subprocess
+import argparse
 import importlib
+import threading
 
-def echo_info(message):
-    """Print info message with PRF formatting"""
-    print(f"[INFO]  ℹ️  {message}")
+from self_heal_common import (
+    PREFIX_INFO, PREFIX_OK, RULE, banner,
+    echo_info, echo_ok, echo_warn, echo_fail,
+    module_available, heal_packages,
+)
 
-def echo_ok(message):
-    """Print success message with PRF formatting"""
-    print(f"[PASS]  ✅ {message}")
+# Updated dependencies for GitHub catalog system: (package, import, pip spec)
+REQUIRED_DEPENDENCIES = (
+    # Core GUI framework
+    ("PyQt5", "PyQt5.QtWidgets", "PyQt5>=5.15.0"),
+    # Data processing
+    ("pandas", "pandas", "pandas>=1.3.0"),
+    # Image processing
+    ("Pillow", "PIL", "Pillow>=8.0.0"),
+    # OpenAI API
+    ("openai", "openai", "openai>=1.0.0"),
+    # GitHub API (CRITICAL for new catalog system)
+    ("requests", "requests", "requests>=2.25.0")
+)
 
-def echo_warn(message):
-    """Print warning message with PRF formatting"""
-    print(f"[WARN]  ⚠️  {message}")
+# Updated core modules for GitHub catalog system
+CORE_MODULES = (
+    'core.vision_handler',
+    'core.enhanced_vision_handler',  # NEW
+    'core.multi_llm_analyzer',       # NEW
+    'core.image_processor',
+    'core.github_catalog',           # NEW (replaces aws_uploader)
+    'core.csv_generator',
+    'core.utils'
+)
 
-def echo_fail(message):
-    """Print failure message with PRF formatting"""
-    print(f"[FAIL]  ❌ {message}")
+# Status lines printed by heal_packages
+HEAL_MESSAGES = {
+    "present": "{package} - Already available",
+    "missing": "{package} - Missing, initiating self-healing...",
+    "install": "Self-healing: pip install {pips}",
+    "healed": "{package} - Self-healing successful",
+    "import_fails": "{package} - Self-healing completed but import still fails",
+    "install_failed": "{package} - Self-healing failed",
+}
+
+STARTUP_BANNER = banner(
+    (PREFIX_INFO, "🚀 PRF-COMPLIANT SELF-HEALING LAUNCHER"),
+    (PREFIX_INFO, RULE),
+    (PREFIX_INFO, "WHAT: GitHub Catalog System with Self-Healing Dependencies"),
+    (PREFIX_INFO, "WHY: Prevents crashes from missing imports per PRF requirements"),
+    (PREFIX_INFO, RULE),
+)
+LAUNCH_BANNER = banner(
+    (PREFIX_INFO, RULE),
+    (PREFIX_OK, "🎉 ALL SELF-HEALING CHECKS PASSED"),
+    (PREFIX_OK, "✅ Launching GitHub Catalog System..."),
+    (PREFIX_INFO, RULE),
+)
+
+def parse_args(argv=None):
+    """Parse launcher flags; argv defaults to sys.argv[1:]"""
+    parser = argparse.ArgumentParser(
+        description="PRF-compliant self-healing launcher for the GitHub Catalog System"
+    )
+    parser.add_argument("--no-heal", action="store_true",
+                        help="skip dependency self-healing "
+                             "(same as POSTCARD_LISTER_SKIP_HEAL=1)")
+    parser.add_argument("--deep-check", action="store_true",
+                        help="import each core module so errors in its "
+                             "top-level code are reported before launch")
+    return parser.parse_args(argv)
+
+def _skip_heal_reason(args):
+    """Return why dependency self-healing should be skipped, or None to run it"""
+    if getattr(sys, "frozen", False):
+        return "frozen/bundled build"
+    if args.no_heal:
+        return "--no-heal"
+    if os.environ.get("POSTCARD_LISTER_SKIP_HEAL") == "1":
+        return "POSTCARD_LISTER_SKIP_HEAL=1"
+    return None
 
 def self_heal_package(package_name, import_name=None, pip_name=None):
     """
@@ -44,38 +110,8 @@ def self_heal_package(package_name, import_name=None, pip_name=None):
     if pip_name is None:
         pip_name = package_name
     
-    try:
-        # Try to import the package
-        importlib.import_module(import_name)
-        echo_ok(f"{package_name} - Already available")
-        return True
-    except ImportError:
-        echo_warn(f"{package_name} - Missing, initiating self-healing...")
-        
-        try:
-            # Self-heal by installing via pip
-            echo_info(f"Self-healing: pip install {pip_name}")
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", pip_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Verify self-healing worked
-            importlib.import_module(import_name)
-            echo_ok(f"{package_name} - Self-healing successful")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            echo_fail(f"{package_name} - Self-healing failed: {e}")
-            return False
-        except ImportError:
-            echo_fail(f"{package_name} - Self-healing completed but import still fails")
-            return False
-        except Exception as e:
-            echo_fail(f"{package_name} - Unexpected self-healing error: {e}")
-            return False
+    _, failed = heal_packages([(package_name, import_name, pip_name)], HEAL_MESSAGES)
+    return not failed
 
 def self_heal_all_dependencies():
     """
@@ -86,39 +122,18 @@ def self_heal_all_dependencies():
     DEBUG: Logs all dependency self-healing attempts
     """
     echo_info("🔧 PRF Self-Healing Dependency Management")
-    echo_info("=" * 60)
-    
-    # Updated dependencies for GitHub catalog system
-    dependencies = [
-        # Core GUI framework
-        ("PyQt5", "PyQt5.QtWidgets", "PyQt5>=5.15.0"),
-        # Data processing
-        ("pandas", "pandas", "pandas>=1.3.0"),
-        # Image processing
-        ("Pillow", "PIL", "Pillow>=8.0.0"),
-        # OpenAI API
-        ("openai", "openai", "openai>=1.0.0"),
-        # GitHub API (CRITICAL for new catalog system)
-        ("requests", "requests", "requests>=2.25.0")
-    ]
+    echo_info(RULE)
     
-    failed_packages = []
-    healed_packages = []
+    dependencies = REQUIRED_DEPENDENCIES
     
     echo_info(f"Self-healing {len(dependencies)} dependencies...")
     
-    for package_name, import_name, pip_name in dependencies:
-        echo_info(f"Checking {package_name}...")
-        
-        if self_heal_package(package_name, import_name, pip_name):
-            healed_packages.append(package_name)
-        else:
-            failed_packages.append(package_name)
+    healed_packages, failed_packages = heal_packages(dependencies, HEAL_MESSAGES)
     
     # Report self-healing results
-    echo_info("=" * 60)
+    echo_info(RULE)
     echo_info("🎯 SELF-HEALING RESULTS")
-    echo_info("=" * 60)
+    echo_info(RULE)
     
     echo_ok(f"Successfully healed: {len(healed_packages)}/{len(dependencies)} packages")
     
@@ -133,34 +148,38 @@ def self_heal_all_dependencies():
     echo_ok("✅ All dependencies self-healed successfully")
     return True
 
-def check_core_modules():
+def _import_error(module):
+    """Import a module for real; return the error message, or None on success"""
+    try:
+        importlib.import_module(module)
+        return None
+    except Exception as e:
+        return str(e) or type(e).__name__
+
+def check_core_modules(deep=False):
     """
     WHAT: Check availability of core application modules
     WHY: Ensures application modules are present before launch
     FAIL: Returns False if core modules are missing
     UX: Shows module availability status
-    DEBUG: Logs module import attempts
+    DEBUG: Logs module import attempts; deep=True (--deep-check) imports each
+           module so errors in its top-level code surface here
     """
     echo_info("📋 Checking core modules...")
     
-    # Updated core modules for GitHub catalog system
-    core_modules = [
-        'core.vision_handler',
-        'core.enhanced_vision_handler',  # NEW
-        'core.multi_llm_analyzer',       # NEW
-        'core.image_processor',
-        'core.github_catalog',           # NEW (replaces aws_uploader)
-        'core.csv_generator',
-        'core.utils'
-    ]
+    if deep:
+        # Real imports run each module's top-level code, surfacing its errors
+        errors = [_import_error(module) for module in CORE_MODULES]
+    else:
+        errors = [None if found else "not found on sys.path"
+                  for found in map(module_available, CORE_MODULES)]
     
     missing = []
-    for module in core_modules:
-        try:
-            importlib.import_module(module)
+    for module, error in zip(CORE_MODULES, errors):
+        if error is None:
             echo_ok(f"{module} - Available")
-        except ImportError as e:
-            echo_fail(f"{module} - Missing: {e}")
+        else:
+            echo_fail(f"{module} - Missing: {error}")
             missing.append(module)
     
     if missing:
@@ -182,16 +201,18 @@ def check_configuration():
     echo_info("⚙️ Checking configuration system...")
     
     try:
-        # Check if config directory exists
-        if not os.path.exists("config"):
+        # One directory read answers all three existence checks
+        try:
+            config_files = set(os.listdir("config"))
+        except (FileNotFoundError, NotADirectoryError):
             echo_fail("config/ directory missing")
             return False
         
         # Check if settings files exist
-        if not os.path.exists("config/settings.json"):
+        if "settings.json" not in config_files:
             echo_warn("config/settings.json missing - will be created from template")
         
-        if not os.path.exists("config/settings.template.json"):
+        if "settings.template.json" not in config_files:
             echo_fail("config/settings.template.json missing")
             return False
         
@@ -202,7 +223,26 @@ def check_configuration():
         echo_fail(f"Configuration check failed: {e}")
         return False
 
-def launch_application():
+def preload_application():
+    """
+    WHAT: Start importing app_integrated on a background thread
+    WHY: Its PyQt5/pandas imports then overlap the remaining startup checks
+         instead of blocking after them
+    FAIL: Errors are swallowed; launch_application repeats the import and reports them
+    UX: Silent; startup output is unchanged
+    DEBUG: Thread is named "app-preload"
+    """
+    def _import_app():
+        try:
+            importlib.import_module("app_integrated")
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_import_app, name="app-preload", daemon=True)
+    thread.start()
+    return thread
+
+def launch_application(preload=None):
     """
     WHAT: Launch the integrated application
     WHY: Start the main application after all checks pass
@@ -213,6 +253,8 @@ def launch_application():
     echo_info("🚀 Launching integrated application...")
     
     try:
+        if preload is not None:
+            preload.join()
         from app_integrated import main as app_main
         echo_ok("Application module loaded successfully")
         
@@ -229,7 +271,7 @@ def launch_application():
         echo_fail(f"Traceback: {traceback.format_exc()}")
         sys.exit(1)
 
-def main():
+def main(argv=None):
     """
     WHAT: Main entry point for PRF-compliant self-healing launcher
     WHY: Orchestrates all self-healing checks and application launch
@@ -237,22 +279,27 @@ def main():
     UX: Provides comprehensive startup feedback
     DEBUG: Logs all startup operations and results
     """
-    echo_info("🚀 PRF-COMPLIANT SELF-HEALING LAUNCHER")
-    echo_info("=" * 60)
-    echo_info("WHAT: GitHub Catalog System with Self-Healing Dependencies")
-    echo_info("WHY: Prevents crashes from missing imports per PRF requirements")
-    echo_info("=" * 60)
+    args = parse_args(argv)
+    sys.stdout.write(STARTUP_BANNER)
     
     try:
         # Step 1: Self-heal all dependencies
         echo_info("Step 1: Self-healing dependencies...")
-        if not self_heal_all_dependencies():
+        skip_reason = _skip_heal_reason(args)
+        # Preload only when nothing needs installing, so the background import
+        # never races a pip install of the same packages
+        preload = None
+        if skip_reason or all(module_available(import_name) for _, import_name, _ in REQUIRED_DEPENDENCIES):
+            preload = preload_application()
+        if skip_reason:
+            echo_info(f"Dependency self-healing skipped ({skip_reason})")
+        elif not self_heal_all_dependencies():
             echo_fail("❌ Dependency self-healing failed")
             sys.exit(1)
         
         # Step 2: Check core modules
         echo_info("Step 2: Checking core modules...")
-        if not check_core_modules():
+        if not check_core_modules(deep=args.deep_check):
             echo_fail("❌ Core module check failed")
             sys.exit(1)
         
@@ -264,12 +311,9 @@ def main():
         
         # Step 4: Launch application
         echo_info("Step 4: Launching application...")
-        echo_info("=" * 60)
-        echo_ok("🎉 ALL SELF-HEALING CHECKS PASSED")
-        echo_ok("✅ Launching GitHub Catalog System...")
-        echo_info("=" * 60)
+        sys.stdout.write(LAUNCH_BANNER)
         
-        launch_application()
+        launch_application(preload)
         
     except KeyboardInterrupt:
         echo_warn("⚠️ Startup interrupted by user")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+################################################################################
+# FILE: self_heal_common.py
+# DESC: Shared helpers for the PRF self-healing launchers
+# SPEC: PRF-COMPOSITE-2025-06-18-SELF-HEAL-COMMON
+# WHAT: PRF status output, module probing and pip installs used by
+#       run_integrated_self_heal.py and self_heal_dependencies.py
+# WHY: One copy keeps the self-healing scripts from drifting apart; the
+#      fallback run_integrated.py keeps its own probe so it runs without them
+# FAIL: Helpers return False instead of raising; callers decide whether to exit
+# UX: Same [INFO]/[PASS]/[WARN]/[FAIL] prefixes everywhere
+# DEBUG: pip stderr is logged for every failed install
+################################################################################
+
+import sys
+import subprocess
+import importlib
+import importlib.util
+import functools
+
+# PRF status prefixes, built once; echo_* only append the message
+PREFIX_INFO = "[INFO]  ℹ️  "
+PREFIX_OK = "[PASS]  ✅ "
+PREFIX_WARN = "[WARN]  ⚠️  "
+PREFIX_FAIL = "[FAIL]  ❌ "
+
+RULE = "=" * 60
+
+def banner(*lines):
+    """Join (prefix, text) pairs into one block that main() emits in a single write"""
+    return "".join(f"{prefix}{text}\n" for prefix, text in lines)
+
+def _emit(prefix, message):
+    # sys.stdout already block-buffers when it is not a TTY, so a single
+    # write per line is all the batching needed
+    sys.stdout.write(f"{prefix}{message}\n")
+
+def echo_info(message):
+    """Print info message with PRF formatting"""
+    _emit(PREFIX_INFO, message)
+
+def echo_ok(message):
+    """Print success message with PRF formatting"""
+    _emit(PREFIX_OK, message)
+
+def echo_warn(message):
+    """Print warning message with PRF formatting"""
+    _emit(PREFIX_WARN, message)
+
+def echo_fail(message):
+    """Print failure message with PRF formatting"""
+    _emit(PREFIX_FAIL, message)
+
+@functools.lru_cache(maxsize=None)
+def module_available(import_name):
+    """
+    WHAT: Check whether a module is importable without executing it
+    WHY: find_spec only locates the module; importing PyQt5/pandas just to
+         probe them costs seconds and tens of MB at every launch
+    FAIL: Returns False when the module or one of its parents is missing
+    UX: Silent helper
+    DEBUG: Callers log the result; call module_available.cache_clear()
+           after installing anything
+    """
+    if sys.modules.get(import_name) is not None:
+        return True  # Already imported in this process; skip the finders
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        # Raised when a parent package is itself missing or broken
+        return False
+
+def pip_install(pip_names):
+    """Run one pip install; return True, or False after logging pip's error"""
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", *pip_names],
+            # Progress output is never shown; keep only stderr for failures
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        echo_fail(f"pip install failed: {e}")
+        if e.stderr:
+            echo_fail(f"pip stderr: {e.stderr.strip()}")
+    except Exception as e:
+        echo_fail(f"Unexpected error during pip install: {e}")
+    return False
+
+def heal_packages(packages, messages):
+    """
+    WHAT: Install any missing packages, trying a single pip invocation first
+    WHY: pip's own startup dominates each install; one call for all missing
+         packages pays it once and lets the resolver solve them together
+    FAIL: If the batch fails, each package is retried alone so one bad
+          requirement cannot block the others; packages still not
+          importable afterwards are returned as failed
+    UX: messages maps each status (present, missing, install, healed,
+        import_fails, install_failed) to a template taking {package} or {pips}
+    DEBUG: Logs pip's stderr for every failed install
+    """
+    ok = []
+    missing = []
+    for package_name, import_name, pip_name in packages:
+        if module_available(import_name):
+            echo_ok(messages["present"].format(package=package_name))
+            ok.append(package_name)
+        else:
+            echo_warn(messages["missing"].format(package=package_name))
+            missing.append((package_name, import_name, pip_name))
+
+    if not missing:
+        return ok, []
+
+    pip_names = [pip_name for _, _, pip_name in missing]
+    echo_info(messages["install"].format(pips=" ".join(pip_names)))
+    installed = set()
+    if pip_install(pip_names):
+        installed.update(pip_names)
+    elif len(pip_names) > 1:
+        # One unresolvable package sinks the whole batch; install the rest alone
+        echo_info("Retrying each package individually...")
+        for pip_name in pip_names:
+            echo_info(messages["install"].format(pips=pip_name))
+            if pip_install([pip_name]):
+                installed.add(pip_name)
+
+    # Verify the installs worked; a real import is needed here
+    importlib.invalidate_caches()
+    module_available.cache_clear()
+    failed = []
+    for package_name, import_name, pip_name in missing:
+        try:
+            importlib.import_module(import_name)
+            echo_ok(messages["healed"].format(package=package_name))
+            ok.append(package_name)
+        except ImportError:
+            if pip_name in installed:
+                echo_fail(messages["import_fails"].format(package=package_name))
+            else:
+                echo_fail(messages["install_failed"].format(package=package_name))
+            failed.append(package_name)
+    return ok, failed
@@ -11,26 +11,52 @@
 ################################################################################
 
 import sys
-import subprocess
-import importlib
 import os
 from pathlib import Path
 
-def echo_info(message):
-    """Print info message with PRF formatting"""
-    print(f"[INFO]  ℹ️  {message}")
+from self_heal_common import (
+    PREFIX_INFO, PREFIX_OK, RULE, banner,
+    echo_info, echo_ok, echo_warn, echo_fail,
+    heal_packages,
+)
 
-def echo_ok(message):
-    """Print success message with PRF formatting"""
-    print(f"[PASS]  ✅ {message}")
+# All required dependencies: (package, import name, pip spec, critical)
+REQUIRED_DEPENDENCIES = (
+    # Core GUI framework
+    ("PyQt5", "PyQt5.QtWidgets", "PyQt5>=5.15.0", True),
+    # Data processing
+    ("pandas", "pandas", "pandas>=1.3.0", True),
+    # Image processing
+    ("Pillow", "PIL", "Pillow>=8.0.0", True),
+    # OpenAI API
+    ("openai", "openai", "openai>=1.0.0", True),
+    # GitHub API (NEW - for catalog system)
+    ("requests", "requests", "requests>=2.25.0", True)
+)
 
-def echo_warn(message):
-    """Print warning message with PRF formatting"""
-    print(f"[WARN]  ⚠️  {message}")
+# Status lines printed by heal_packages
+HEAL_MESSAGES = {
+    "present": "{package} - Already installed",
+    "missing": "{package} - Missing, attempting self-healing installation...",
+    "install": "Installing {pips} via pip...",
+    "healed": "{package} - Successfully installed and verified",
+    "import_fails": "{package} - Installation succeeded but import still fails",
+    "install_failed": "{package} - Installation failed",
+}
 
-def echo_fail(message):
-    """Print failure message with PRF formatting"""
-    print(f"[FAIL]  ❌ {message}")
+STARTUP_BANNER = banner(
+    (PREFIX_INFO, "🚀 PRF-COMPLIANT SELF-HEALING DEPENDENCY MANAGER"),
+    (PREFIX_INFO, RULE),
+    (PREFIX_INFO, "WHAT: Auto-detects and installs missing Python dependencies"),
+    (PREFIX_INFO, "WHY: Prevents crashes from missing imports per PRF requirements"),
+    (PREFIX_INFO, RULE),
+)
+COMPLETE_BANNER = banner(
+    (PREFIX_INFO, RULE),
+    (PREFIX_OK, "🎉 SELF-HEALING COMPLETE - ALL SYSTEMS READY"),
+    (PREFIX_OK, "✅ Application can now be launched safely"),
+    (PREFIX_INFO, RULE),
+)
 
 def check_and_install_package(package_name, import_name=None, pip_name=None):
     """
@@ -45,39 +71,8 @@ def check_and_install_package(package_name, import_name=None, pip_name=None):
     if pip_name is None:
         pip_name = package_name
     
-    try:
-        # Try to import the package
-        importlib.import_module(import_name)
-        echo_ok(f"{package_name} - Already installed")
-        return True
-    except ImportError:
-        echo_warn(f"{package_name} - Missing, attempting self-healing installation...")
-        
-        try:
-            # Attempt to install via pip
-            echo_info(f"Installing {pip_name} via pip...")
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", pip_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Verify installation worked
-            importlib.import_module(import_name)
-            echo_ok(f"{package_name} - Successfully installed and verified")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            echo_fail(f"{package_name} - pip install failed: {e}")
-            echo_fail(f"pip stderr: {e.stderr}")
-            return False
-        except ImportError:
-            echo_fail(f"{package_name} - Installation succeeded but import still fails")
-            return False
-        except Exception as e:
-            echo_fail(f"{package_name} - Unexpected error during installation: {e}")
-            return False
+    _, failed = heal_packages([(package_name, import_name, pip_name)], HEAL_MESSAGES)
+    return not failed
 
 def self_heal_all_dependencies():
     """
@@ -88,75 +83,25 @@ def self_heal_all_dependencies():
     DEBUG: Logs all dependency checks and installation attempts
     """
     echo_info("🔧 PRF Self-Healing Dependency Management")
-    echo_info("=" * 60)
-    
-    # Define all required dependencies
-    dependencies = [
-        # Core GUI framework
-        {
-            "package": "PyQt5",
-            "import": "PyQt5.QtWidgets",
-            "pip": "PyQt5>=5.15.0",
-            "critical": True
-        },
-        # Data processing
-        {
-            "package": "pandas",
-            "import": "pandas",
-            "pip": "pandas>=1.3.0",
-            "critical": True
-        },
-        # Image processing
-        {
-            "package": "Pillow",
-            "import": "PIL",
-            "pip": "Pillow>=8.0.0",
-            "critical": True
-        },
-        # OpenAI API
-        {
-            "package": "openai",
-            "import": "openai",
-            "pip": "openai>=1.0.0",
-            "critical": True
-        },
-        # GitHub API (NEW - for catalog system)
-        {
-            "package": "requests",
-            "import": "requests",
-            "pip": "requests>=2.25.0",
-            "critical": True
-        }
-    ]
-    
-    failed_critical = []
-    failed_optional = []
-    installed_count = 0
+    echo_info(RULE)
     
+    dependencies = REQUIRED_DEPENDENCIES
     echo_info(f"Checking {len(dependencies)} dependencies...")
     
-    for dep in dependencies:
-        package_name = dep["package"]
-        import_name = dep["import"]
-        pip_name = dep["pip"]
-        is_critical = dep["critical"]
-        
-        echo_info(f"Checking {package_name}...")
-        
-        success = check_and_install_package(package_name, import_name, pip_name)
-        
-        if success:
-            installed_count += 1
-        else:
-            if is_critical:
-                failed_critical.append(package_name)
-            else:
-                failed_optional.append(package_name)
+    installed, failed = heal_packages(
+        [(package, import_name, pip_name) for package, import_name, pip_name, _ in dependencies],
+        HEAL_MESSAGES
+    )
+    installed_count = len(installed)
+    failed_critical = [package for package, _, _, critical in dependencies
+                       if critical and package in failed]
+    failed_optional = [package for package, _, _, critical in dependencies
+                       if not critical and package in failed]
     
     # Report results
-    echo_info("=" * 60)
+    echo_info(RULE)
     echo_info("🎯 DEPENDENCY SELF-HEALING RESULTS")
-    echo_info("=" * 60)
+    echo_info(RULE)
     
     echo_ok(f"Successfully verified/installed: {installed_count}/{len(dependencies)} packages")
     
@@ -234,11 +179,7 @@ def main():
     UX: Provides comprehensive status and progress feedback
     DEBUG: Logs all operations and results
     """
-    echo_info("🚀 PRF-COMPLIANT SELF-HEALING DEPENDENCY MANAGER")
-    echo_info("=" * 60)
-    echo_info("WHAT: Auto-detects and installs missing Python dependencies")
-    echo_info("WHY: Prevents crashes from missing imports per PRF requirements")
-    echo_info("=" * 60)
+    sys.stdout.write(STARTUP_BANNER)
     
     try:
         # Step 1: Check Python version
@@ -254,10 +195,7 @@ def main():
             echo_fail("❌ Dependency self-healing failed")
             sys.exit(1)
         
-        echo_info("=" * 60)
-        echo_ok("🎉 SELF-HEALING COMPLETE - ALL SYSTEMS READY")
-        echo_ok("✅ Application can now be launched safely")
-        echo_info("=" * 60)
+        sys.stdout.write(COMPLETE_BANNER)
         
         return True
         
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+################################################################################
+# FILE: test_prf_upload_commit.py
+# DESC: Test script for the auto-commit step of prf_upload_to_github.py
+# SPEC: PRF-COMPOSITE-2025-06-18-GITHUB-UPLOAD-COMMIT
+# WHAT: Runs commit_if_needed against throwaway git repositories
+# WHY: Its porcelain v2 parser decides which paths are staged and committed
+# FAIL: Exits with error if any change is left uncommitted or mis-staged
+# UX: Shows each test result and a final summary
+# DEBUG: Logs the paths passed to git add
+################################################################################
+
+import os
+import sys
+import subprocess
+import tempfile
+from contextlib import contextmanager
+
+import prf_upload_to_github as upload
+
+def echo_info(message):
+    """Print info message with PRF formatting"""
+    print(f"[INFO]  ℹ️  {message}")
+
+def echo_ok(message):
+    """Print success message with PRF formatting"""
+    print(f"[PASS]  ✅ {message}")
+
+def echo_fail(message):
+    """Print failure message with PRF formatting"""
+    print(f"[FAIL]  ❌ {message}")
+
+def git(*args):
+    """Run git in the current directory and return its stdout as bytes"""
+    return subprocess.run(["git", *args], check=True, stdout=subprocess.PIPE).stdout
+
+def write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+@contextmanager
+def temp_repo():
+    """Create an empty repo on branch main and chdir into it for the block"""
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            git("init", "-q")
+            git("symbolic-ref", "HEAD", "refs/heads/main")
+            git("config", "user.name", "PRF Test")
+            git("config", "user.email", "prf-test@example.com")
+            git("config", "commit.gpgsign", "false")
+            yield tmp
+        finally:
+            os.chdir(old_cwd)
+
+@contextmanager
+def record_git_add():
+    """Collect the paths commit_if_needed passes to git add"""
+    added = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        if "add" in cmd:
+            added.extend(cmd[cmd.index("--") + 1:])
+        return real_run(cmd, *args, **kwargs)
+
+    subprocess.run = run
+    try:
+        yield added
+    finally:
+        subprocess.run = real_run
+
+def pending_changes():
+    """Every change git still reports, untracked files included"""
+    return git("status", "--porcelain=v2", "-z", "--untracked-files=all")
+
+def committed_paths():
+    return set(git("ls-tree", "-r", "-z", "--name-only", "HEAD").split(b"\0")) - {b""}
+
+def test_commit_if_needed_change_kinds():
+    """
+    WHAT: Commit modified, deleted, staged-only, renamed and untracked paths
+    WHY: Each kind is a different porcelain v2 record; odd names must stay literal
+    FAIL: Assertion error naming the path that was missed or mis-staged
+    UX: Shows the paths passed to git add
+    DEBUG: Rename source is named like a record to catch a missed skip
+    """
+    echo_info("Testing auto-commit of every change kind...")
+    with temp_repo():
+        for name in ("modified.txt", "deleted.txt", "staged.txt", "? src.txt"):
+            write(name, f"{name}\n")
+        git("add", "--all")
+        git("commit", "-q", "-m", "base")
+
+        write("modified.txt", "changed\n")
+        os.remove("deleted.txt")
+        write("staged.txt", "staged\n")
+        git("add", "staged.txt")
+        git("mv", "? src.txt", "renamed.txt")
+        write("renamed.txt", "renamed and edited\n")
+        os.mkdir("newdir")
+        write(os.path.join("newdir", "inner.txt"), "inner\n")
+        write("*.log", "glob-like\n")
+        write(":(top)odd", "pathspec magic\n")
+        write("new\nline.txt", "newline\n")
+
+        with record_git_add() as added:
+            branch = upload.commit_if_needed()
+        echo_info(f"git add paths: {added}")
+
+        assert branch == "main", branch
+        assert pending_changes() == b"", pending_changes()
+        paths = committed_paths()
+        for expected in (b"modified.txt", b"staged.txt", b"renamed.txt",
+                         b"newdir/inner.txt", b"*.log", b":(top)odd", b"new\nline.txt"):
+            assert expected in paths, expected
+        assert b"deleted.txt" not in paths
+        assert b"? src.txt" not in paths
+        # Staged-only changes need no git add; the rename source is never a path to add
+        assert b"staged.txt" not in added, added
+        assert b"src.txt" not in added and b"? src.txt" not in added, added
+    echo_ok("All change kinds committed")
+
+def test_commit_if_needed_unmerged():
+    """
+    WHAT: Commit a conflict that was resolved in the worktree but not staged
+    WHY: Unmerged "u" records carry ten fields before the path
+    FAIL: Assertion error if the merge commit is not created
+    UX: Shows the merge parents
+    DEBUG: Conflict is created with a real merge
+    """
+    echo_info("Testing auto-commit of an unmerged path...")
+    with temp_repo():
+        write("conflict.txt", "base\n")
+        git("add", "conflict.txt")
+        git("commit", "-q", "-m", "base")
+        git("checkout", "-q", "-b", "other")
+        write("conflict.txt", "other\n")
+        git("commit", "-q", "-am", "other")
+        git("checkout", "-q", "main")
+        write("conflict.txt", "main\n")
+        git("commit", "-q", "-am", "main")
+        subprocess.run(["git", "merge", "-q", "other"], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+        write("conflict.txt", "resolved\n")
+
+        with record_git_add() as added:
+            upload.commit_if_needed()
+
+        assert added == [b"conflict.txt"], added
+        assert pending_changes() == b"", pending_changes()
+        parents = git("rev-list", "--parents", "-n", "1", "HEAD").split()
+        assert len(parents) == 3, parents
+        assert git("show", "HEAD:conflict.txt") == b"resolved\n"
+    echo_ok("Unmerged path committed as a merge")
+
+def test_argv_chunks_budget():
+    """
+    WHAT: Check that _argv_chunks charges each argument its argv pointer
+    WHY: Thousands of short paths hit E2BIG long before their bytes do
+    FAIL: Assertion error if a chunk exceeds the budget
+    UX: Shows the chunk sizes
+    DEBUG: One-byte paths cost 10 bytes each (byte, NUL, pointer)
+    """
+    echo_info("Testing argv chunking budget...")
+    chunks = list(upload._argv_chunks([b"x"] * 25, budget=100))
+    echo_info(f"Chunk sizes: {[len(chunk) for chunk in chunks]}")
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    echo_ok("Chunks respect the argv budget")
+
+def main():
+    """
+    WHAT: Main test runner for the auto-commit step
+    WHY: Validates commit_if_needed outside pytest as well
+    FAIL: Exits with error code if any tests fail
+    UX: Shows complete test results and summary
+    DEBUG: Logs all test operations and final status
+    """
+    tests = [
+        ("Change Kinds", test_commit_if_needed_change_kinds),
+        ("Unmerged Path", test_commit_if_needed_unmerged),
+        ("Argv Budget", test_argv_chunks_budget),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except (AssertionError, SystemExit) as e:
+            echo_fail(f"{test_name} FAILED: {e}")
+
+    echo_info(f"🎯 AUTO-COMMIT TEST RESULTS: {passed}/{len(tests)} PASSED")
+    return passed == len(tests)
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)